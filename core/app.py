@@ -6,7 +6,6 @@ for the application to function. It serves as the entry point for the system.
 """
 
 import asyncio
-import machine
 import micropython
 import time
 
@@ -118,11 +117,8 @@ async def main():
         ),
     )
 
-    button_timer = machine.Timer(conf.BUTTON_TIMER_ID)
-
     inverter = InverterController(
         power_button_pin=conf.INVERTER_POWER_BUTTON_PIN,
-        power_button_timer=button_timer,
         power_gate_pin=conf.INVERTER_POWER_GATE_PIN,
         uart=uart,
         uart_rx_pin=conf.INVERTER_UART_RX_PIN,
@@ -136,7 +132,6 @@ async def main():
 
     psu = PowerSupplyController(
         power_button_pin=conf.PSU_POWER_BUTTON_PIN,
-        power_button_timer=button_timer,
         power_gate_pin=conf.PSU_POWER_GATE_PIN,
         current_a_pin=conf.PSU_CURRENT_A_PIN,
         current_b_pin=conf.PSU_CURRENT_B_PIN,
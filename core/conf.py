@@ -24,8 +24,6 @@ LOGGER_LEVEL = const(3)
 # Inverter and PSU UART interfaces
 UART_IF = const(2)
 
-BUTTON_TIMER_ID = const(0)
-
 BMS_BAUD_RATE = const(115200)
 BMS_UART_IF = const(1)
 BMS_UART_RX_PIN = const(42)
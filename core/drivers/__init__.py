@@ -7,6 +7,7 @@ used in the system, such as state management and hardware interaction.
 
 import asyncio
 import gc
+import struct
 import time
 
 import machine
@@ -32,6 +33,7 @@ class UART:
         _interface (int): The UART interface number.
         _baud_rate (int): The baud rate for UART communication.
         _timeout (int): The timeout for UART operations.
+        _lock (asyncio.Lock): Serializes asynchronous query transactions.
     """
 
     _active = None
@@ -39,6 +41,7 @@ class UART:
     _interface = None
     _baud_rate = None
     _timeout = None
+    _lock = None
 
     def __init__(self, interface, timeout=None):
         """
@@ -51,6 +54,7 @@ class UART:
         self._interface = interface
         self._timeout = timeout
         self._uart = machine.UART(self._interface)
+        self._lock = asyncio.Lock()
 
     def init(self, rx=None, tx=None, baud_rate=9600):
         """
@@ -91,6 +95,32 @@ class UART:
 
         return self._uart.read()
 
+    async def query_async(self, frame, delay=0, buffer=None):
+        """
+        Sends a query frame and reads the response.
+
+        Other tasks keep running while the device prepares its response, while
+        the lock keeps other queries off the bus until the response is read.
+
+        Args:
+            frame (bytes): The frame to send.
+            delay (int, optional): Delay in milliseconds before reading the response.
+            buffer (bytearray, optional): Preallocated buffer receiving the response.
+
+        Returns:
+            int | bytes: The number of bytes read into the buffer if one is given,
+                otherwise the response data.
+        """
+        async with self._lock:
+            logger.debug("UART query", self._interface, frame)
+            self._uart.write(frame)
+            if delay:
+                await asyncio.sleep_ms(delay)
+
+            if buffer is None:
+                return self._uart.read()
+            return self._uart.readinto(buffer) or 0
+
     def sample(self, timeout=1000, max_size=512):
         """
         Reads data from the UART interface.
@@ -193,6 +223,10 @@ class BaseState:
 
     _callbacks = None
 
+    # reusable buffer backing the packed BLE state
+    _ble_state_buffer = None
+    _ble_state_view = None
+
     def __init__(self):
         """
         Initializes the BaseState instance.
@@ -408,12 +442,12 @@ class BaseState:
         Packs a cell voltage value.
 
         Args:
-            voltage (int): The cell voltage.
+            voltage (int): The cell voltage, None or 0 when unknown.
 
         Returns:
             int: The packed voltage value.
         """
-        if voltage is None:
+        if not voltage:
             return 0
 
         return 1 + int(voltage / 10) - 250
@@ -448,6 +482,27 @@ class BaseState:
             return 0
         return int(value * factor) + 1
 
+    def _pack_ble_state(self, fmt, *values):
+        """
+        Packs values into a reusable BLE state buffer.
+
+        The buffer is allocated on the first call and reused afterwards, so
+        frequent notifications do not allocate a new bytes object every time.
+
+        Args:
+            fmt (str): The struct format of the BLE state.
+            *values: The values to pack.
+
+        Returns:
+            memoryview: A view over the packed BLE state.
+        """
+        if self._ble_state_buffer is None:
+            self._ble_state_buffer = bytearray(struct.calcsize(fmt))
+            self._ble_state_view = memoryview(self._ble_state_buffer)
+
+        struct.pack_into(fmt, self._ble_state_buffer, 0, *values)
+        return self._ble_state_view
+
     def get_ble_state(self):
         """
         Creates a snapshot for BLE current and historical state.
@@ -6,8 +6,6 @@ classes, which manage the state and control logic for the automatic transfer
 switch functionality.
 """
 
-import struct
-
 import machine
 
 from const import BLE_ATS_STATE_UUID, ATS_MODE_NONE, ATS_MODE_CITY, ATS_MODE_BATTERY
@@ -35,10 +33,10 @@ class ATSState(BaseState):
         Get the BLE representation of the ATS state.
 
         Returns:
-            bytes: The packed BLE state of the ATS.
+            memoryview: The packed BLE state of the ATS.
         """
         logger.debug("Getting ATS BLE state")
-        return struct.pack(
+        return self._pack_ble_state(
             ">BB",
             self._pack(self.mode),
             self._pack(self.internal_errors),
@@ -37,12 +37,54 @@ _IRQ_CENTRAL_DISCONNECT = const(2)
 _IRQ_GATTS_WRITE = const(3)
 _IRQ_GATTS_READ_REQUEST = const(4)
 
+# errno codes raised by gatts_notify while the stack is out of buffers
+_ENOMEM = const(12)
+_EBUSY = const(16)
+
+_NOTIFY_ATTEMPTS = const(3)
+_NOTIFY_RETRY_MS = const(3)
+
 _ADV_TYPE_FLAGS = const(0x01)
 _ADV_TYPE_NAME = const(0x09)
 _ADV_TYPE_UUID16_COMPLETE = 0x03
 _ADV_TYPE_UUID128_COMPLETE = const(0x07)
 _ADV_TYPE_APPEARANCE = const(0x19)
 
+# both advertised services use 16-bit UUIDs, so their AD structures are fixed
+_ADV_SERVICES = (
+    bytes((3, _ADV_TYPE_UUID16_COMPLETE))
+    + bytes(BLE_INFO_SERVICE_UUID)
+    + bytes((3, _ADV_TYPE_UUID16_COMPLETE))
+    + bytes(BLE_CORE_SERVICE_UUID)
+)
+
+# compact ids of the core service characteristics, in registration order
+_ATS = const(0)
+_BMS = const(1)
+_INVERTER = const(2)
+_PSU = const(3)
+_MCU = const(4)
+_OTA = const(5)
+_LOG = const(6)
+_HISTORY = const(7)
+_COMMAND = const(8)
+
+# device states readable and notified by the core service
+_DEVICE_STATES = const(6)
+
+_CORE_CHARACTERISTICS = (
+    BLE_ATS_STATE_UUID,
+    BLE_BMS_STATE_UUID,
+    BLE_INVERTER_STATE_UUID,
+    BLE_PSU_STATE_UUID,
+    BLE_MCU_STATE_UUID,
+    BLE_OTA_STATE_UUID,
+    BLE_LOG_STATE_UUID,
+    BLE_HISTORY_STATE_UUID,
+    BLE_RUN_COMMAND_UUID,
+)
+_CHARACTERISTIC_IDS = {uuid: i for i, uuid in enumerate(_CORE_CHARACTERISTICS)}
+
 COMMAND_PULL_HISTORY = const(0x01)
 COMMAND_PSU_ENABLE = const(0x10)
 COMMAND_PSU_DISABLE = const(0x11)
@@ -59,6 +101,26 @@ COMMAND_START_LOG = const(0x60)
 COMMAND_STOP_LOG = const(0x61)
 
 
+class _DisconnectedPeer:
+    """
+    Stand-in for the BLE stack while no central is connected.
+
+    Swapped in for the real BLE instance on disconnect so that state
+    notifications need no connection checks on every call.
+    """
+
+    @staticmethod
+    def gatts_write(handle, data):
+        pass
+
+    @staticmethod
+    def gatts_notify(connection, handle, data):
+        pass
+
+
+_DISCONNECTED = _DisconnectedPeer()
+
+
 class BLEState(BaseState):
     """
     Represents the state of the BLE module.
@@ -81,6 +143,8 @@ class BLEServerController:
 
     Attributes:
         HANDLE (dict): A mapping of BLE UUIDs to their handles.
+        _handles (list): Core service handles indexed by characteristic id.
+        _handle_ids (dict): A mapping of core service handles to characteristic ids.
     """
 
     _name = None
@@ -89,6 +153,18 @@ class BLEServerController:
     _connection = None
     _service = None
 
+    # BLE stack while a central is connected, otherwise a no-op stand-in
+    _peer = _DISCONNECTED
+
+    _handles = None
+    _handle_ids = None
+
+    # device state getters indexed by characteristic id
+    _read_getters = None
+
+    # copies of the last notified device states indexed by characteristic id
+    _last_sent = None
+
     HANDLE = {
         BLE_ATS_STATE_UUID: None,
         BLE_BMS_STATE_UUID: None,
@@ -136,6 +212,7 @@ class BLEServerController:
         self._state = BLEState()
 
         self._gap_name = gap_name
+        self._adv_payload = self._get_advertisement_payload(gap_name)
         self._manufacturer = manufacturer
         self._model = model
         self._firmware = firmware
@@ -155,6 +232,28 @@ class BLEServerController:
         self._mcu.state.attach_ble(self)
         self._ota.state.attach_ble(self)
 
+        self._handles = [None] * len(_CORE_CHARACTERISTICS)
+        self._handle_ids = {}
+        self._read_getters = (
+            self._ats.state.get_ble_state,
+            self._bms.state.get_ble_state,
+            self._inverter.state.get_ble_state,
+            self._psu.state.get_ble_state,
+            self._mcu.state.get_ble_state,
+            self._ota.state.get_ble_state,
+        )
+        self._last_sent = [bytearray() for _ in range(_DEVICE_STATES)]
+
+        prepare = self._instructions.prepare
+        self._psu_on = prepare(self._psu.on)
+        self._psu_off = prepare(self._psu.off)
+        self._inverter_on = prepare(self._inverter.on)
+        self._inverter_off = prepare(self._inverter.off)
+        self._ats_enable_profile = prepare(self._profile.set, PROFILE_KEY_ATS, b"\x01")
+        self._ats_disable_profile = prepare(self._profile.set, PROFILE_KEY_ATS, b"\x00")
+        self._ats_enable = prepare(self._ats.enable)
+        self._ats_disable = prepare(self._ats.disable)
+
     async def run(self):
         """
         Run the BLE server.
@@ -237,36 +336,25 @@ class BLEServerController:
         self._ble.gatts_write(self.HANDLE[BLE_MODEL_NUMBER_UUID], self._model)
         self._ble.gatts_write(self.HANDLE[BLE_FIRMWARE_REV_UUID], self._firmware)
 
+        self._handles = [self.HANDLE[uuid] for uuid in _CORE_CHARACTERISTICS]
+        self._handle_ids = {handle: i for i, handle in enumerate(self._handles)}
+
         self.start_advertising()
 
     @staticmethod
-    def _get_advertisement_payload(name=None, services=None, appearance=0):
+    def _get_advertisement_payload(name=None):
         """
         Generate the advertisement payload.
 
         Args:
             name (str): The device name.
-            services (list): List of service UUIDs.
-            appearance (int): Appearance value.
 
         Returns:
-            bytearray: The advertisement payload.
+            bytes: The advertisement payload.
         """
-        payload = bytearray()
-        if name:
-            payload += struct.pack("BB", len(name) + 1, _ADV_TYPE_NAME) + name
-
-        if services:
-            for uuid in services:
-                b = bytes(uuid)
-                if len(b) == 2:
-                    payload += struct.pack("BB", 3, _ADV_TYPE_UUID16_COMPLETE) + b
-                elif len(b) == 16:
-                    payload += (
-                        struct.pack("BB", len(b) + 1, _ADV_TYPE_UUID128_COMPLETE) + b
-                    )
-
-        return payload
+        if not name:
+            return _ADV_SERVICES
+        return bytes((len(name) + 1, _ADV_TYPE_NAME)) + name + _ADV_SERVICES
 
     def start_advertising(self):
         """
@@ -275,12 +363,7 @@ class BLEServerController:
         if not self._ble:
             return
 
-        adv_data = self._get_advertisement_payload(
-            name=self._gap_name,
-            services=[BLE_INFO_SERVICE_UUID, BLE_CORE_SERVICE_UUID],
-            appearance=960,
-        )
-        self._ble.gap_advertise(100000, adv_data)
+        self._ble.gap_advertise(100000, self._adv_payload)
 
     def stop_advertising(self):
         """
@@ -300,6 +383,8 @@ class BLEServerController:
             logger.info("BLE client connected")
             connection, addr_type, addr = data
             self._connection = connection
+            self._peer = self._ble
+            self._forget_sent()
             self._state.active = True
             return self.stop_advertising()
 
@@ -307,6 +392,7 @@ class BLEServerController:
             logger.info("BLE client disconnected")
             connection, _, _ = data
             self._connection = None
+            self._peer = _DISCONNECTED
             self._state.active = False
             self.start_advertising()
 
@@ -326,41 +412,13 @@ class BLEServerController:
             connection: The BLE connection.
             handle: The attribute handle being read.
         """
-        if handle == self.HANDLE[BLE_ATS_STATE_UUID]:
-            state = self._ats.state.get_ble_state()
-            logger.info("BLE reading ATS state", state, len(state))
-            self._ble_write(handle, state)
-            return
-
-        if handle == self.HANDLE[BLE_BMS_STATE_UUID]:
-            state = self._bms.state.get_ble_state()
-            logger.info("BLE reading BMS state", state, len(state))
-            self._ble_write(handle, state)
+        characteristic = self._handle_ids.get(handle)
+        if characteristic is None or characteristic >= _DEVICE_STATES:
             return
 
-        if handle == self.HANDLE[BLE_INVERTER_STATE_UUID]:
-            state = self._inverter.state.get_ble_state()
-            logger.debug("BLE reading Inverter state", state, len(state))
-            self._ble_write(handle, state)
-            return
-
-        if handle == self.HANDLE[BLE_PSU_STATE_UUID]:
-            state = self._psu.state.get_ble_state()
-            logger.debug("BLE reading PSU state", state, len(state))
-            self._ble_write(handle, state)
-            return
-
-        if handle == self.HANDLE[BLE_MCU_STATE_UUID]:
-            state = self._mcu.state.get_ble_state()
-            logger.debug("BLE reading MCU state", state, len(state))
-            self._ble_write(handle, state)
-            return
-
-        if handle == self.HANDLE[BLE_OTA_STATE_UUID]:
-            state = self._ota.state.get_ble_state()
-            logger.debug("BLE reading OTA state", state, len(state))
-            self._ble_write(handle, state)
-            return
+        state = self._read_getters[characteristic]()
+        logger.debug("BLE reading state", handle, len(state))
+        self._ble_write(handle, state)
 
     def on_write_state(self, connection, handle):
         """
@@ -379,7 +437,7 @@ class BLEServerController:
             return
 
         logger.info("BLE received data", data.hex())
-        if handle != self.HANDLE[BLE_RUN_COMMAND_UUID]:
+        if self._handle_ids.get(handle) != _COMMAND:
             logger.warning("BLE not a run command")
             return
 
@@ -394,11 +452,11 @@ class BLEServerController:
 
         if subcommand == COMMAND_PSU_ENABLE:
             logger.debug("Turn on PSU via BLE command")
-            self._instructions.add(self._psu.on)
+            self._instructions.add_prepared(self._psu_on)
 
         if subcommand == COMMAND_PSU_DISABLE:
             logger.debug("Turn off PSU via BLE command")
-            self._instructions.add(self._psu.off)
+            self._instructions.add_prepared(self._psu_off)
 
         if subcommand == COMMAND_PSU_TURBO:
             logger.debug("Set PSU turbo via BLE command")
@@ -407,21 +465,21 @@ class BLEServerController:
 
         if subcommand == COMMAND_INVERTER_ENABLE:
             logger.debug("Turn on INVERTER via BLE command")
-            self._instructions.add(self._inverter.on)
+            self._instructions.add_prepared(self._inverter_on)
 
         if subcommand == COMMAND_INVERTER_DISABLE:
             logger.debug("Turn off INVERTER via BLE command")
-            self._instructions.add(self._inverter.off)
+            self._instructions.add_prepared(self._inverter_off)
 
         if subcommand == COMMAND_ATS_ENABLE:
             logger.debug("Turn on ATS via BLE command")
-            self._instructions.add(self._profile.set, PROFILE_KEY_ATS, b"\x01")
-            self._instructions.add(self._ats.enable)
+            self._instructions.add_prepared(self._ats_enable_profile)
+            self._instructions.add_prepared(self._ats_enable)
 
         if subcommand == COMMAND_ATS_DISABLE:
             logger.debug("Turn off ATS via BLE command")
-            self._instructions.add(self._profile.set, PROFILE_KEY_ATS, b"\x00")
-            self._instructions.add(self._ats.disable)
+            self._instructions.add_prepared(self._ats_disable_profile)
+            self._instructions.add_prepared(self._ats_disable)
 
         if subcommand == COMMAND_CONF_SET_KEY:
             param = struct.unpack_from(">B", data, 1)[0]
@@ -451,19 +509,42 @@ class BLEServerController:
         """
         Notify a BLE client of a state change.
 
+        The state is handed to the BLE stack as is, so a memoryview over a
+        reusable state buffer is written and notified without being copied.
+        While no central is connected the call goes to a no-op peer. Device
+        states identical to the last notified value are skipped.
+
         Args:
             uuid: The UUID of the state.
-            state: The state data to notify.
+            state (bytes | memoryview): The state data to notify.
         """
-        if not self._ble or self._connection is None:
+        characteristic = _CHARACTERISTIC_IDS.get(uuid)
+        if characteristic is None:
             return
 
-        if self.HANDLE.get(uuid):
-            try:
-                self._ble_write(self.HANDLE.get(uuid), state)
-                self._ble_notify(self._connection, self.HANDLE.get(uuid), state)
-            except OSError:
-                pass
+        is_device_state = characteristic < _DEVICE_STATES
+        if is_device_state and self._last_sent[characteristic] == state:
+            return
+
+        handle = self._handles[characteristic]
+        self._ble_write(handle, state)
+        if not self._ble_notify(self._connection, handle, state):
+            return
+
+        # only a delivered state suppresses identical ones later
+        if is_device_state:
+            sent = self._last_sent[characteristic]
+            if len(sent) == len(state):
+                sent[:] = state
+            else:
+                self._last_sent[characteristic] = bytearray(state)
+
+    def _forget_sent(self):
+        """
+        Forget the last notified device states so a new client gets them all.
+        """
+        for characteristic in range(_DEVICE_STATES):
+            self._last_sent[characteristic] = bytearray()
 
     def _ble_write(self, handle, data):
         """
@@ -471,10 +552,10 @@ class BLEServerController:
 
         Args:
             handle: The attribute handle.
-            data: The data to write.
+            data (bytes | memoryview): The data to write.
         """
         try:
-            self._ble.gatts_write(handle, data)
+            self._peer.gatts_write(handle, data)
         except Exception as e:
             logger.critical(e)
 
@@ -482,15 +563,27 @@ class BLEServerController:
         """
         Send a BLE notification.
 
+        Notifications rejected because the stack is out of buffers are retried
+        a few times after a short pause instead of being dropped.
+
         Args:
             connection: The BLE connection.
             handle: The attribute handle.
-            data: The data to notify.
+            data (bytes | memoryview): The data to notify.
+
+        Returns:
+            bool: True if the notification was handed to the stack, False otherwise.
         """
-        try:
-            self._ble.gatts_notify(connection, handle, data)
-        except OSError:
-            pass
+        for _ in range(_NOTIFY_ATTEMPTS):
+            try:
+                self._peer.gatts_notify(connection, handle, data)
+                return True
+            except OSError as e:
+                # give the stack a moment to drain its buffers and retry
+                if e.args[0] not in (_ENOMEM, _EBUSY):
+                    return False
+                time.sleep_ms(_NOTIFY_RETRY_MS)
+        return False
 
     @property
     def state(self):
@@ -13,14 +13,16 @@ state of charge, and current, while also providing control functions for chargin
 discharging operations.
 """
 
+import array
+import asyncio
 import struct
 
-import math
+import micropython
+from micropython import const
 
-import const
 from drivers import BaseState, UART
 from lib.history import HistoricalData
-from logging import logger
+from logging import logger, LogLevels
 
 from const import (
     HISTORY_BMS_SOC,
@@ -33,8 +35,125 @@ from const import (
     DATA_TYPE_WORD,
     BLE_BMS_STATE_UUID,
     PROFILE_KEY_MCU_POWER,
+    EVENT_BATTERY_CHARGED,
+    EVENT_BATTERY_DISCHARGED,
 )
 
+# descriptors outside the fixed status block, folded by the compiler
+_DESCRIPTOR_CELLS = const(0x79)
+_DESCRIPTOR_CAPACITY = const(0xAA)
+
+# descriptors 0x80..0x9C that follow the cell voltages, in frame order
+_STATUS_FIELDS = (
+    (0x80, "H"),  # mos_temperature
+    (0x81, "H"),  # sensor1_temperature
+    (0x82, "h"),  # sensor2_temperature
+    (0x83, "H"),  # voltage
+    (0x84, "H"),  # current
+    (0x85, "B"),  # soc
+    (0x86, "B"),  # temperature_sensors
+    (0x87, "H"),  # cycles
+    (0x89, "I"),  # cycle_capacity
+    (0x8A, "H"),  # battery_strings
+    (0x8B, "H"),  # external_errors
+    (0x8C, "H"),  # state
+    (0x8E, "H"),  # total_over_voltage_protection
+    (0x8F, "H"),  # total_under_voltage_protection
+    (0x90, "H"),  # cell_over_voltage_protection
+    (0x91, "H"),  # cell_over_voltage_recovery
+    (0x92, "H"),  # cell_over_voltage_delay
+    (0x93, "H"),  # cell_under_voltage_protection
+    (0x94, "H"),  # cell_under_voltage_recovery
+    (0x95, "H"),  # cell_under_voltage_delay
+    (0x96, "H"),  # cell_pressure_difference
+    (0x97, "H"),  # discharge_over_current
+    (0x98, "H"),  # discharge_over_current_delay
+    (0x99, "H"),  # charge_over_current
+    (0x9A, "H"),  # charge_over_current_delay
+    (0x9B, "H"),  # balancing_voltage
+    (0x9C, "H"),  # balancing_pressure_difference
+)
+_STATUS_FORMAT = ">" + "".join("B" + fmt for _, fmt in _STATUS_FIELDS)
+_STATUS_SIZE = struct.calcsize(_STATUS_FORMAT)
+_STATUS_DESCRIPTORS = tuple(descriptor for descriptor, _ in _STATUS_FIELDS)
+
+# temperature sensor block between the 0x9C and 0xAA descriptors, never read
+_TEMPERATURE_SENSORS_SIZE = 37
+
+# capacity descriptor (0xAA) relative to the start of the status block
+_CAPACITY_OFFSET = _STATUS_SIZE + _TEMPERATURE_SENSORS_SIZE
+
+# status responses are about 300 bytes long
+_RESPONSE_SIZE = 512
+
+# cell voltage descriptor (0x79) offset: header, length, terminal id,
+# command, source and transport type
+_CELLS_OFFSET = 11
+
+_BLE_STATE_FORMAT = ">HHHBBBBBBBBBBHB"
+
+_CELL_HISTORY_KEYS = (
+    HISTORY_BMS_CELL1_VOLTAGE,
+    HISTORY_BMS_CELL2_VOLTAGE,
+    HISTORY_BMS_CELL3_VOLTAGE,
+    HISTORY_BMS_CELL4_VOLTAGE,
+)
+
+# flags combined with the cell index by _scan_cells
+_CELL_UNDER_VOLTAGE = const(1)
+_CELL_OVER_VOLTAGE = const(2)
+
+
+@micropython.viper
+def _scan_cells(cells: ptr16, count: int, valid: int, low: int, high: int) -> int:
+    """
+    Finds the first parsed cell outside the voltage thresholds.
+
+    Args:
+        cells (array): Per-cell voltages in millivolts.
+        count (int): Number of cells.
+        valid (int): Bitmask of the cells holding a parsed voltage.
+        low (int): Minimum voltage in millivolts, 0 to disable.
+        high (int): Maximum voltage in millivolts, 0 to disable.
+
+    Returns:
+        int: The cell index shifted left by 2 and combined with
+            _CELL_UNDER_VOLTAGE or _CELL_OVER_VOLTAGE, or 0 if all cells are in range.
+    """
+    if low == 0 and high == 0:
+        return 0
+
+    i = 0
+    while i < count:
+        if valid & (1 << i):
+            voltage = int(cells[i])
+            if low != 0 and voltage < low:
+                return (i << 2) | _CELL_UNDER_VOLTAGE
+            if high != 0 and voltage > high:
+                return (i << 2) | _CELL_OVER_VOLTAGE
+        i += 1
+    return 0
+
+
+@micropython.viper
+def _frame_sum(frame: ptr8, size: int) -> int:
+    """
+    Sums the first bytes of a frame, the basis of the JK BMS checksum.
+
+    Args:
+        frame (bytes): The binary frame.
+        size (int): Number of leading bytes to sum.
+
+    Returns:
+        int: The 16 bit sum of the bytes.
+    """
+    total = 0
+    i = 0
+    while i < size:
+        total += frame[i]
+        i += 1
+    return total & 0xFFFF
+
 
 class BMSErrors:
     """
@@ -89,7 +208,8 @@ class BMSState(BaseState):
     Attributes:
         NAME (str): The name of the state.
         BLE_STATE_UUID (UUID): The BLE UUID for the BMS state.
-        cells (list): Per-cell voltage values in millivolts.
+        cells (array): Per-cell voltage values in millivolts, 0 when unknown.
+        cells_valid (int): Bitmask of the cells holding a parsed voltage.
         mos_temperature (int): MOSFET temperature in tenths of a degree Celsius.
         sensor1_temperature (int): Temperature from sensor 1 in tenths of a degree Celsius.
         sensor2_temperature (int): Temperature from sensor 2 in tenths of a degree Celsius.
@@ -133,7 +253,8 @@ class BMSState(BaseState):
     mcu_consumed = 0
 
     # per cell voltage
-    cells = [None, None, None, None]
+    cells = None
+    cells_valid = 0
 
     mos_temperature = None
     sensor1_temperature = None
@@ -150,8 +271,9 @@ class BMSState(BaseState):
     battery_strings = None
 
     state = None
-    charging_allowed = None
-    discharging_allowed = None
+
+    # charge and discharge switch bits of the state, None until parsed
+    _flags = None
 
     total_over_voltage_protection = None
     total_under_voltage_protection = None
@@ -175,32 +297,57 @@ class BMSState(BaseState):
 
     battery_capacity = None
 
-    history = {
-        HISTORY_BMS_SOC: HistoricalData(
-            chart_type=HISTORY_BMS_SOC,
-            data_type=DATA_TYPE_BYTE,
-        ),
-        HISTORY_BMS_CURRENT: HistoricalData(
-            chart_type=HISTORY_BMS_CURRENT,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_BMS_CELL1_VOLTAGE: HistoricalData(
-            chart_type=HISTORY_BMS_CELL1_VOLTAGE,
-            data_type=DATA_TYPE_BYTE,
-        ),
-        HISTORY_BMS_CELL2_VOLTAGE: HistoricalData(
-            chart_type=HISTORY_BMS_CELL2_VOLTAGE,
-            data_type=DATA_TYPE_BYTE,
-        ),
-        HISTORY_BMS_CELL3_VOLTAGE: HistoricalData(
-            chart_type=HISTORY_BMS_CELL3_VOLTAGE,
-            data_type=DATA_TYPE_BYTE,
-        ),
-        HISTORY_BMS_CELL4_VOLTAGE: HistoricalData(
-            chart_type=HISTORY_BMS_CELL4_VOLTAGE,
-            data_type=DATA_TYPE_BYTE,
-        ),
-    }
+    # derived from current and voltage on every parse
+    _power = 0
+    _direction = 0
+
+    history = None
+    _soc_history_push = None
+    _current_history_push = None
+    _cell_history_push = None
+
+    def __init__(self):
+        """
+        Initializes the BMS state with its own cell and history buffers.
+        """
+        super().__init__()
+        self.cells = array.array("H", (0, 0, 0, 0))
+        self.history = {
+            HISTORY_BMS_SOC: HistoricalData(
+                chart_type=HISTORY_BMS_SOC,
+                data_type=DATA_TYPE_BYTE,
+            ),
+            HISTORY_BMS_CURRENT: HistoricalData(
+                chart_type=HISTORY_BMS_CURRENT,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_BMS_CELL1_VOLTAGE: HistoricalData(
+                chart_type=HISTORY_BMS_CELL1_VOLTAGE,
+                data_type=DATA_TYPE_BYTE,
+            ),
+            HISTORY_BMS_CELL2_VOLTAGE: HistoricalData(
+                chart_type=HISTORY_BMS_CELL2_VOLTAGE,
+                data_type=DATA_TYPE_BYTE,
+            ),
+            HISTORY_BMS_CELL3_VOLTAGE: HistoricalData(
+                chart_type=HISTORY_BMS_CELL3_VOLTAGE,
+                data_type=DATA_TYPE_BYTE,
+            ),
+            HISTORY_BMS_CELL4_VOLTAGE: HistoricalData(
+                chart_type=HISTORY_BMS_CELL4_VOLTAGE,
+                data_type=DATA_TYPE_BYTE,
+            ),
+        }
+
+        # bound push methods of the histories, cells in cell order
+        self._soc_history_push = self.history[HISTORY_BMS_SOC].push
+        self._current_history_push = self.history[HISTORY_BMS_CURRENT].push
+        self._cell_history_push = tuple(
+            self.history[key].push for key in _CELL_HISTORY_KEYS
+        )
+
+        # populate every field on the instance up front
+        self.clear()
 
     def clear(self):
         """
@@ -210,7 +357,10 @@ class BMSState(BaseState):
         initializing a new state. It resets all state variables to None or their
         appropriate default values.
         """
-        self.cells = [None, None, None, None]
+        cells = self.cells
+        for i in range(len(cells)):
+            cells[i] = 0
+        self.cells_valid = 0
 
         self.mos_temperature = None
         self.sensor1_temperature = None
@@ -227,8 +377,7 @@ class BMSState(BaseState):
         self.battery_strings = None
 
         self.state = 0
-        self.charging_allowed = None
-        self.discharging_allowed = None
+        self._flags = None
 
         self.total_over_voltage_protection = None
         self.total_under_voltage_protection = None
@@ -252,6 +401,10 @@ class BMSState(BaseState):
 
         self.battery_capacity = None
 
+        self._power = 0
+        self._direction = 0
+
+    @micropython.native
     def parse(self, response):
         """
         Parse a response from the BMS hardware.
@@ -261,180 +414,93 @@ class BMSState(BaseState):
         current, voltage, and protection parameters.
 
         Args:
-            response (bytes): The binary response data to parse from the BMS hardware.
+            response (memoryview): The binary response data to parse from the BMS hardware.
 
         Raises:
-            AssertionError: If the response format is invalid or descriptors don't match.
+            AssertionError: If the frame is truncated, the checksum is invalid or
+                descriptors don't match.
         """
-        _, size = struct.unpack_from(">HH", response)
-
-        offset = response.find(b"\x79")
-        descriptor, cell_charge_size = struct.unpack_from(">BB", response, offset)
-        assert descriptor == 0x79
-        offset += 2
-
+        # reject foreign or truncated frames before any decoding work
+        assert response[0] == 0x4E and response[1] == 0x57
+
+        # big-endian frame length following the 2 byte header
+        size = (response[2] << 8) | response[3]
+        assert len(response) >= size + 2
+
+        # the checksum trails the frame and covers everything up to the end marker
+        end = size - 2
+        checksum = _frame_sum(response, end)
+        assert checksum == (response[end + 2] << 8) | response[end + 3]
+
+        assert response[_CELLS_OFFSET] == _DESCRIPTOR_CELLS
+        cell_charge_size = response[_CELLS_OFFSET + 1]
+        offset = _CELLS_OFFSET + 2
+
+        # each cell is a 1 byte index followed by a big-endian voltage
+        cells = self.cells
+        cells_valid = 0
+        position = offset + 1
         for i in range(cell_charge_size // 3):
-            cell_index, cell_charge = struct.unpack_from(
-                ">BH", response, offset + i * 3
-            )
-            self.cells[i] = cell_charge
+            cells[i] = (response[position] << 8) | response[position + 1]
+            cells_valid |= 1 << i
+            position += 3
+        self.cells_valid = cells_valid
         offset += cell_charge_size
 
-        descriptor, self.mos_temperature = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x80
-        offset += 3
-
-        descriptor, self.sensor1_temperature = struct.unpack_from(
-            ">BH", response, offset
+        values = struct.unpack_from(_STATUS_FORMAT, response, offset)
+        assert values[::2] == _STATUS_DESCRIPTORS
+        (
+            self.mos_temperature,
+            self.sensor1_temperature,
+            self.sensor2_temperature,
+            self.voltage,
+            self.current,
+            self.soc,
+            self.temperature_sensors,
+            self.cycles,
+            self.cycle_capacity,
+            self.battery_strings,
+            self.external_errors,
+            self.state,
+            self.total_over_voltage_protection,
+            self.total_under_voltage_protection,
+            self.cell_over_voltage_protection,
+            self.cell_over_voltage_recovery,
+            self.cell_over_voltage_delay,
+            self.cell_under_voltage_protection,
+            self.cell_under_voltage_recovery,
+            self.cell_under_voltage_delay,
+            self.cell_pressure_difference,
+            self.discharge_over_current,
+            self.discharge_over_current_delay,
+            self.charge_over_current,
+            self.charge_over_current_delay,
+            self.balancing_voltage,
+            self.balancing_pressure_difference,
+        ) = values[1::2]
+        self._flags = self.state & 0x03
+
+        # the highest current bit carries the direction, computed once per frame
+        self._direction = (self.current >> 15) & 0x01
+        self._power = (self.current & 0x7FFF) * self.voltage // 10000
+
+        # ... skip temperature sensors following the 0x9C descriptor ...
+        offset += _CAPACITY_OFFSET
+
+        assert response[offset] == _DESCRIPTOR_CAPACITY
+        self.battery_capacity = (
+            (response[offset + 1] << 24)
+            | (response[offset + 2] << 16)
+            | (response[offset + 3] << 8)
+            | response[offset + 4]
         )
-        assert descriptor == 0x81
-        offset += 3
-
-        descriptor, self.sensor2_temperature = struct.unpack_from(
-            ">Bh", response, offset
-        )
-        assert descriptor == 0x82
-        offset += 3
-
-        descriptor, self.voltage = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x83
-        offset += 3
-
-        descriptor, self.current = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x84
-        offset += 3
-
-        descriptor, self.soc = struct.unpack_from(">BB", response, offset)
-        assert descriptor == 0x85
-        offset += 2
-
-        descriptor, self.temperature_sensors = struct.unpack_from(
-            ">BB", response, offset
-        )
-        assert descriptor == 0x86
-        offset += 2
-
-        descriptor, self.cycles = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x87
-        offset += 3
-
-        descriptor, self.cycle_capacity = struct.unpack_from(">BI", response, offset)
-        assert descriptor == 0x89
-        offset += 5
-
-        descriptor, self.battery_strings = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x8A
-        offset += 3
-
-        descriptor, self.external_errors = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x8B
-        offset += 3
-
-        descriptor, self.state = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x8C
-        self.charging_allowed = bool(self.state & 0x01)
-        self.discharging_allowed = bool(self.state & 0x02)
-        offset += 3
-
-        descriptor, self.total_over_voltage_protection = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x8E
-        offset += 3
-
-        descriptor, self.total_under_voltage_protection = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x8F
-        offset += 3
-
-        descriptor, self.cell_over_voltage_protection = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x90
-        offset += 3
-
-        descriptor, self.cell_over_voltage_recovery = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x91
-        offset += 3
-
-        descriptor, self.cell_over_voltage_delay = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x92
-        offset += 3
-
-        descriptor, self.cell_under_voltage_protection = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x93
-        offset += 3
-
-        descriptor, self.cell_under_voltage_recovery = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x94
-        offset += 3
-
-        descriptor, self.cell_under_voltage_delay = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x95
-        offset += 3
-
-        descriptor, self.cell_pressure_difference = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x96
-        offset += 3
-
-        descriptor, self.discharge_over_current = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x97
-        offset += 3
-
-        descriptor, self.discharge_over_current_delay = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x98
-        offset += 3
-
-        descriptor, self.charge_over_current = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x99
-        offset += 3
-
-        descriptor, self.charge_over_current_delay = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x9A
-        offset += 3
-
-        descriptor, self.balancing_voltage = struct.unpack_from(">BH", response, offset)
-        assert descriptor == 0x9B
-        offset += 3
-
-        descriptor, self.balancing_pressure_difference = struct.unpack_from(
-            ">BH", response, offset
-        )
-        assert descriptor == 0x9C
-        offset += 40
-
-        # ... skip temperature sensors ...
-
-        descriptor, self.battery_capacity = struct.unpack_from(">BI", response, offset)
-        assert descriptor == 0xAA
-        offset += 4
 
         if self.external_errors:
             self.set_error(self.ERROR_EXTERNAL)
         else:
             self.reset_error(self.ERROR_EXTERNAL)
 
+    @micropython.native
     def build_history(self):
         """
         Build historical data for the BMS metrics.
@@ -443,40 +509,31 @@ class BMSState(BaseState):
         current, and per-cell voltages. This data is used for tracking battery
         performance over time and can be used for analysis and diagnostics.
         """
-        self.history[HISTORY_BMS_SOC].push(self._pack(self.get_soc()))
-        self.history[HISTORY_BMS_CURRENT].push(self._pack(self.current))
+        self._soc_history_push(self._pack(self.get_soc()))
+        self._current_history_push(self._pack(self.current))
 
-        self.history[HISTORY_BMS_CELL1_VOLTAGE].push(
-            self._pack(self._pack_cell_voltage(self.cells[0]))
-        )
-        self.history[HISTORY_BMS_CELL2_VOLTAGE].push(
-            self._pack(self._pack_cell_voltage(self.cells[1]))
-        )
-        self.history[HISTORY_BMS_CELL3_VOLTAGE].push(
-            self._pack(self._pack_cell_voltage(self.cells[2]))
-        )
-        self.history[HISTORY_BMS_CELL4_VOLTAGE].push(
-            self._pack(self._pack_cell_voltage(self.cells[3]))
-        )
+        cells = self.cells
+        pack_cell = self._pack_cell_history
+        for i, push in enumerate(self._cell_history_push):
+            push(pack_cell(cells[i]))
 
     @staticmethod
-    def crc(frame):
+    def _pack_cell_history(voltage):
         """
-        Calculate the CRC (Cyclic Redundancy Check) for a given frame.
+        Packs a cell voltage for the history buffer.
 
-        This method computes a simple checksum by summing all bytes in the frame
-        and returning the high and low bytes of the result.
+        Equivalent to _pack(_pack_cell_voltage(voltage)) in a single step.
 
         Args:
-            frame (bytes): The binary frame to calculate the CRC for.
+            voltage (int): The cell voltage.
 
         Returns:
-            list: A two-element list containing the high and low bytes of the CRC.
+            int: The packed voltage value.
         """
-        result = 0
-        for b in frame:
-            result += b
-        return [(result >> 8) & 0xFF, result & 0xFF]
+        if not voltage:
+            return 1
+
+        return voltage // 10 - 248
 
     def get_ble_state(self):
         """
@@ -487,16 +544,25 @@ class BMSState(BaseState):
         status, temperatures, and cell voltages.
 
         Returns:
-            bytes: The packed BLE state data of the BMS.
+            memoryview: The packed BLE state data of the BMS.
         """
-        return struct.pack(
-            ">HHHBBBBBBBBBBHB",
+        # pack the MOSFET switch bits the same way _pack_bool does,
+        # straight from the raw flags
+        flags = self._flags
+        if flags is None:
+            charging = discharging = 0x00
+        else:
+            charging = 0x02 if flags & 0x01 else 0x01
+            discharging = 0x02 if flags & 0x02 else 0x01
+
+        return self._pack_ble_state(
+            _BLE_STATE_FORMAT,
             self._pack(self.voltage),
             self._pack(self.current),
             self._pack_float(self.mcu_consumed),
             self._pack(self.get_soc()),
-            self._pack_bool(self.charging_allowed),
-            self._pack_bool(self.discharging_allowed),
+            charging,
+            discharging,
             self._pack_bms_temperature(self.mos_temperature),
             self._pack_bms_temperature(self.sensor1_temperature),
             self._pack_bms_temperature(self.sensor2_temperature),
@@ -508,6 +574,30 @@ class BMSState(BaseState):
             self._pack(self.internal_errors),
         )
 
+    @property
+    def charging_allowed(self):
+        """
+        Whether charging is currently allowed.
+
+        Returns:
+            bool: The charge MOSFET switch state, or None if unknown.
+        """
+        if self._flags is None:
+            return None
+        return bool(self._flags & 0x01)
+
+    @property
+    def discharging_allowed(self):
+        """
+        Whether discharging is currently allowed.
+
+        Returns:
+            bool: The discharge MOSFET switch state, or None if unknown.
+        """
+        if self._flags is None:
+            return None
+        return bool(self._flags & 0x02)
+
     def get_soc(self):
         if (
             self.soc is None
@@ -516,8 +606,9 @@ class BMSState(BaseState):
         ):
             return
 
-        mcu_consumption_percentage = math.floor(
-            100 * self.mcu_consumed / self.battery_capacity
+        # floor(x / n) == floor(x) // n for a positive integer n
+        mcu_consumption_percentage = (
+            int(100 * self.mcu_consumed) // self.battery_capacity
         )
         return self.soc - mcu_consumption_percentage
 
@@ -526,39 +617,36 @@ class BMSState(BaseState):
         Determine the current flow direction in the battery.
 
         Returns:
-            int: A value indicating the direction of the current flow (0 for discharge,
-                 non-zero for charge).
+            int: The direction of the current flow, 0 for discharge and 1 for charge.
         """
-        return self.current & (1 << 15)
+        return self._direction
 
     def get_power(self):
         """
         Calculate the instantaneous power of the battery.
 
-        This method computes the power in watts based on the current voltage and
-        current values. The calculation accounts for the sign of the current to
-        determine if power is being consumed (positive) or generated (negative).
+        The power in watts is derived from the voltage and current values when a
+        response is parsed. The direction bit of the current is masked out, use
+        get_direction to tell charge from discharge.
 
         Returns:
             int: The calculated power in watts, or 0 if current or voltage is None.
         """
-        if not self.current or not self.voltage:
-            return 0
-
-        current = (self.current & (0xFFFF >> 1)) / 100
-        return int(current * self.voltage / 100)
+        return self._power
 
     def increase_mcu_consumption(self, period, power, voltage):
         ah = ((period / 3600) * power) / (voltage / 100)
         self.mcu_consumed += ah
-        logger.debug("mcu inc consumption", ah, self.mcu_consumed)
+        if logger.is_enabled(LogLevels.DEBUG):
+            logger.debug("mcu inc consumption", ah, self.mcu_consumed)
 
     def decrease_mcu_consumption(self, period, power, voltage):
         ah = ((period / 3600) * power) / (voltage / 100)
         self.mcu_consumed -= ah
         if self.mcu_consumed < 0:
             self.mcu_consumed = 0
-        logger.debug("mcu dec consumption", ah, self.mcu_consumed)
+        if logger.is_enabled(LogLevels.DEBUG):
+            logger.debug("mcu dec consumption", ah, self.mcu_consumed)
 
     def reset_mcu_consumption(self):
         logger.debug("reset mcu consumption")
@@ -596,7 +684,7 @@ class BMSController:
 
     HEADER = b"\x4e\x57"
 
-    # Jikong BMS request signature
+    # Jikong BMS request signatures, sent as-is with the checksum already appended
     STATUS_REQUEST = b"\x4e\x57\x00\x13\x00\x00\x00\x00\x06\x03\x00\x00\x00\x00\x00\x00\x68\x00\x00\x01\x29"
 
     ENABLE_CHARGE = b"\x4e\x57\x00\x14\x00\x00\x00\x00\x02\x03\x02\xab\x01\x00\x00\x00\x00\x68\x00\x00\x01\xd4"
@@ -622,9 +710,17 @@ class BMSController:
     _turn_off_min_voltage = None
     _turn_off_max_voltage = None
 
+    # the same thresholds in millivolts, compared against raw cell values
+    _turn_off_min_mv = 0
+    _turn_off_max_mv = 0
+
     _uart = None
     _state: BMSState = None
 
+    # reusable buffer receiving status responses
+    _response = None
+    _response_view = None
+
     def __init__(
         self,
         baud_rate=BAUD_RATE,
@@ -649,6 +745,8 @@ class BMSController:
             profile (object, optional): The profile object to use for battery metrics. Defaults to None.
         """
         self._state = BMSState()
+        self._response = bytearray(_RESPONSE_SIZE)
+        self._response_view = memoryview(self._response)
         self._uart = UART(
             interface=uart_if,
         )
@@ -665,9 +763,11 @@ class BMSController:
 
         if turn_off_min_voltage:
             self._turn_off_min_voltage = turn_off_min_voltage
+            self._turn_off_min_mv = round(turn_off_min_voltage * 1000)
 
         if turn_off_max_voltage:
             self._turn_off_max_voltage = turn_off_max_voltage
+            self._turn_off_max_mv = round(turn_off_max_voltage * 1000)
 
     async def run(self):
         """
@@ -681,10 +781,10 @@ class BMSController:
         and handles any communication errors that may occur.
         """
         logger.info("Running BMS controller")
-        self.request_status(delay=50)
+        await self.request_status(delay=50)
 
         while True:
-            self.request_status()
+            await self.request_status()
             self.state.snapshot()
             await self.state.sleep()
 
@@ -718,7 +818,7 @@ class BMSController:
         if self._profile:
             self._profile.set(PROFILE_KEY_MCU_POWER, self.state.mcu_consumed, False)
 
-    def request_status(self, delay=100):
+    async def request_status(self, delay=100):
         """
         Request the current status from the BMS hardware.
 
@@ -735,23 +835,28 @@ class BMSController:
                  False if a communication error occurred.
         """
         self.update_mcu_consumption()
-        data = self._uart.query(self.STATUS_REQUEST, delay=delay)
-        if data:
+        size = await self._uart.query_async(
+            self.STATUS_REQUEST, delay=delay, buffer=self._response
+        )
+        if size:
             try:
-                logger.debug("BMS response", data)
+                data = self._response_view[:size]
+                if logger.is_enabled(LogLevels.DEBUG):
+                    logger.debug("BMS response", bytes(data))
                 self.state.parse(data)
                 self.check_voltage_thresholds()
                 self.state.reset_error(self._state.ERROR_NO_RESPONSE)
-                logger.info(
-                    "BMS Voltage",
-                    self.state.voltage,
-                    "Temperature: ",
-                    self.state.mos_temperature,
-                    "Power: ",
-                    self.state.get_power(),
-                    "SOC: ",
-                    self.state.get_soc(),
-                )
+                if logger.is_enabled(LogLevels.INFO):
+                    logger.info(
+                        "BMS Voltage",
+                        self.state.voltage,
+                        "Temperature: ",
+                        self.state.mos_temperature,
+                        "Power: ",
+                        self.state.get_power(),
+                        "SOC: ",
+                        self.state.get_soc(),
+                    )
                 return True
             except Exception as e:
                 logger.critical(e)
@@ -772,18 +877,18 @@ class BMSController:
                                  and reading the response. Defaults to 50.
 
         Returns:
-            bool: True if charging was successfully enabled, False otherwise.
+            Task: The scheduled command, resolving to True if the BMS responded.
         """
-        logger.debug("Enabling BMS charging...")
-        data = self._uart.query(self.ENABLE_CHARGE, delay=delay)
-        if data:
-            logger.info("Enabled BMS charging")
-            self._state.reset_error(self._state.ERROR_NO_RESPONSE)
-            return True
-
-        logger.error("Failed to enable BMS charging")
-        self._state.set_error(self._state.ERROR_NO_RESPONSE)
-        return False
+        return asyncio.create_task(
+            self._modify(
+                self.ENABLE_CHARGE,
+                delay,
+                "Enabling BMS charging...",
+                "Enabled BMS charging",
+                "Failed to enable BMS charging",
+                self._state.ERROR_NO_RESPONSE,
+            )
+        )
 
     def disable_charge(self, delay=50):
         """
@@ -797,18 +902,18 @@ class BMSController:
                                  and reading the response. Defaults to 50.
 
         Returns:
-            bool: True if charging was successfully disabled, False otherwise.
+            Task: The scheduled command, resolving to True if the BMS responded.
         """
-        logger.debug("Disabling BMS charging")
-        data = self._uart.query(self.DISABLE_CHARGE, delay=delay)
-        if data:
-            logger.info("Disabled BMS charging")
-            self._state.reset_error(self._state.ERROR_NO_MODIFY_RESPONSE)
-            return True
-
-        logger.error("Failed to disable BMS charging")
-        self._state.set_error(self._state.ERROR_NO_MODIFY_RESPONSE)
-        return False
+        return asyncio.create_task(
+            self._modify(
+                self.DISABLE_CHARGE,
+                delay,
+                "Disabling BMS charging",
+                "Disabled BMS charging",
+                "Failed to disable BMS charging",
+                self._state.ERROR_NO_MODIFY_RESPONSE,
+            )
+        )
 
     def enable_discharge(self, delay=50):
         """
@@ -822,18 +927,18 @@ class BMSController:
                                  and reading the response. Defaults to 50.
 
         Returns:
-            bool: True if discharging was successfully enabled, False otherwise.
+            Task: The scheduled command, resolving to True if the BMS responded.
         """
-        logger.debug("Enabling BMS discharging")
-        data = self._uart.query(self.ENABLE_DISCHARGE, delay=delay)
-        if data:
-            logger.info("Enabled BMS discharging")
-            self._state.reset_error(self._state.ERROR_NO_MODIFY_RESPONSE)
-            return True
-
-        logger.error("Failed to enable BMS discharging")
-        self._state.set_error(self._state.ERROR_NO_MODIFY_RESPONSE)
-        return False
+        return asyncio.create_task(
+            self._modify(
+                self.ENABLE_DISCHARGE,
+                delay,
+                "Enabling BMS discharging",
+                "Enabled BMS discharging",
+                "Failed to enable BMS discharging",
+                self._state.ERROR_NO_MODIFY_RESPONSE,
+            )
+        )
 
     def disable_discharge(self, delay=50):
         """
@@ -847,18 +952,48 @@ class BMSController:
                                  and reading the response. Defaults to 50.
 
         Returns:
-            bool: True if discharging was successfully disabled, False otherwise.
+            Task: The scheduled command, resolving to True if the BMS responded.
+        """
+        return asyncio.create_task(
+            self._modify(
+                self.DISABLE_DISCHARGE,
+                delay,
+                "Disabling BMS discharging",
+                "Disabled BMS discharging",
+                "Failed to disable BMS discharging",
+                self._state.ERROR_NO_MODIFY_RESPONSE,
+            )
+        )
+
+    async def _modify(
+        self, frame, delay, pending_message, done_message, failed_message, error
+    ):
+        """
+        Send a fixed modify command to the BMS and track its outcome.
+
+        Args:
+            frame (bytes): The command frame, with its checksum included.
+            delay (int): The delay in milliseconds between sending the command
+                and reading the response.
+            pending_message (str): Debug message logged before sending.
+            done_message (str): Message logged when the BMS responds.
+            failed_message (str): Message logged when the BMS does not respond.
+            error (int): The error flag reflecting the outcome.
+
+        Returns:
+            bool: True if the BMS responded, False otherwise.
         """
-        data = self._uart.query(self.DISABLE_DISCHARGE, delay=delay)
-        if data:
-            logger.info("Disabled BMS discharging")
-            self._state.reset_error(self._state.ERROR_NO_MODIFY_RESPONSE)
+        logger.debug(pending_message)
+        if await self._uart.query_async(frame, delay=delay):
+            logger.info(done_message)
+            self._state.reset_error(error)
             return True
 
-        logger.error("Failed to disable BMS discharging")
-        self._state.set_error(self._state.ERROR_NO_MODIFY_RESPONSE)
+        logger.error(failed_message)
+        self._state.set_error(error)
         return False
 
+    @micropython.native
     def check_voltage_thresholds(self):
         """
         Process updates from the Battery Management System (BMS).
@@ -867,36 +1002,37 @@ class BMSController:
         exceeds the safety threshold for a sufficient number of confirmations.
         """
         # Check if any cell voltage exceeds the threshold
-        min_voltage_exceeded = False
-        max_voltage_exceeded = False
-
-        for cell_index, voltage in enumerate(self.state.cells):
-            if voltage is None:
-                continue
+        cells = self.state.cells
+        result = _scan_cells(
+            cells,
+            len(cells),
+            self.state.cells_valid,
+            self._turn_off_min_mv,
+            self._turn_off_max_mv,
+        )
+        min_voltage_exceeded = result & _CELL_UNDER_VOLTAGE != 0
+        max_voltage_exceeded = result & _CELL_OVER_VOLTAGE != 0
+        debug = logger.is_enabled(LogLevels.DEBUG)
 
-            # Convert from mV to V
-            voltage_v = voltage / 1000
+        if min_voltage_exceeded and debug:
+            logger.debug(
+                f"Min cell {result >> 2} voltage {cells[result >> 2]}mV exceeds threshold {self._turn_off_min_voltage}V"
+            )
 
-            if self._turn_off_min_voltage and voltage_v < self._turn_off_min_voltage:
-                min_voltage_exceeded = True
-                logger.debug(
-                    f"Min cell {cell_index} voltage {voltage_v}V exceeds threshold {self._turn_off_min_voltage}V"
-                )
-                break
+        if max_voltage_exceeded and debug:
+            logger.debug(
+                f"Max cell {result >> 2} voltage {cells[result >> 2]}mV exceeds threshold {self._turn_off_max_voltage}V"
+            )
 
-            if self._turn_off_max_voltage and voltage_v > self._turn_off_max_voltage:
-                max_voltage_exceeded = True
+        # Update confirmation counter based on voltage status, saturating at the
+        # number of confirmations needed
+        if min_voltage_exceeded or max_voltage_exceeded:
+            if self._turn_off_confirmations < self.TURN_OFF_MAX_CONFIRMATIONS:
+                self._turn_off_confirmations += 1
+            if debug:
                 logger.debug(
-                    f"Max cell {cell_index} voltage {voltage_v}V exceeds threshold {self._turn_off_max_voltage}V"
+                    f"Voltage threshold exceeded: {self._turn_off_confirmations} confirmations"
                 )
-                break
-
-        # Update confirmation counter based on voltage status
-        if any([min_voltage_exceeded, max_voltage_exceeded]):
-            self._turn_off_confirmations += 1
-            logger.debug(
-                f"Voltage threshold exceeded: {self.TURN_OFF_MAX_CONFIRMATIONS} confirmations"
-            )
         else:
             self._turn_off_confirmations = 0
 
@@ -908,14 +1044,14 @@ class BMSController:
             logger.info(
                 f"Battery cell reached max voltage threshold ({self._turn_off_max_voltage}V)"
             )
-            self.state.trigger(const.EVENT_BATTERY_CHARGED)
+            self.state.trigger(EVENT_BATTERY_CHARGED)
             self.state.reset_mcu_consumption()
 
         if min_voltage_exceeded and threshold_triggerred:
             logger.info(
                 f"Battery cell reached min voltage threshold ({self._turn_off_min_voltage}V)"
             )
-            self.state.trigger(const.EVENT_BATTERY_DISCHARGED)
+            self.state.trigger(EVENT_BATTERY_DISCHARGED)
 
     @property
     def state(self):
@@ -5,10 +5,12 @@ This module provides the implementation of the `ButtonController` class, which
 manages button input, including debouncing, state changes, and optional buzzer feedback.
 """
 
+import asyncio
 import time
 import random
 
 import machine
+import micropython
 
 from logging import logger
 
@@ -44,7 +46,8 @@ class ButtonController:
     # Optional buzzer controller
     _buzzer = None
 
-    _long_press_timer = None
+    # Pending long press confirmation
+    _long_press_task = None
 
     def __init__(
         self,
@@ -53,7 +56,6 @@ class ButtonController:
         on_short_press=None,
         on_long_press=None,
         buzzer=None,
-        trigger_timer=None,
         inverted=False,
     ):
         """
@@ -65,16 +67,21 @@ class ButtonController:
             on_short_press (callable): Callback function to execute on short button press.
             on_long_press (callable): Callback function to execute on long button press.
             buzzer (BuzzerController): Optional buzzer controller for feedback.
-            trigger_timer (machine.Timer): Timer for handling button press confirmation.
             inverted (bool, optional): Whether the button is inverted (True for released). Defaults to False.:
         """
         self._buzzer = buzzer
         self._inverted = inverted
         self._on_short_press = on_short_press
         self._on_long_press = on_long_press
-        self._trigger_timer = trigger_timer
         self._trigger_delay = trigger_delay
 
+        # pin level of a pressed button, so the handlers compare a single value
+        self._pressed_value = 0 if inverted else 1
+
+        # bound once, so the pin IRQ does not allocate them on every edge
+        self._on_pressed_ref = self.on_pressed_irq
+        self._on_released_ref = self.on_released_irq
+
         initial_state = machine.Pin.PULL_DOWN
         if self._inverted:
             initial_state = machine.Pin.PULL_UP
@@ -85,7 +92,6 @@ class ButtonController:
             handler=self._check_state,
         )
 
-        self._long_press_timer = machine.Timer(1)
         logger.info(
             f"Button {self._listen_pin} state initialized", self._listen_pin.value()
         )
@@ -97,51 +103,39 @@ class ButtonController:
         Args:
             pin (machine.Pin): The pin that triggered the interrupt.
         """
-        state = pin.value()
-
-        if (self._inverted and not state) or (not self._inverted and state):
-            callback = self.on_pressed_irq
-
-        if (self._inverted and state) or (not self._inverted and not state):
-            callback = self.on_released_irq
-
-        self._trigger_timer.init(
-            period=1,
-            mode=machine.Timer.ONE_SHOT,
-            callback=callback,
-        )
-
-    def on_pressed_irq(self, timer):
-
-        timer.deinit()
+        if pin.value() == self._pressed_value:
+            callback = self._on_pressed_ref
+        else:
+            callback = self._on_released_ref
+
+        # defer the handling out of the IRQ, a full schedule queue drops the edge
+        try:
+            micropython.schedule(callback, None)
+        except RuntimeError:
+            pass
 
+    def on_pressed_irq(self, _):
         if self._cycle_started:
             return
 
         self._cycle_started = True
         current_ms = time.ticks_ms()
-        elapsed_ms = current_ms - self._pressed_at
-        if elapsed_ms < self.JITTER:
-            pass
-
         self._pressed_at = current_ms
         self._released_at = current_ms
 
-        self._long_press_timer.init(
-            period=self._trigger_delay,
-            mode=machine.Timer.ONE_SHOT,
-            callback=self.trigger,
-        )
+        # a new press restarts the long press confirmation
+        task = self._long_press_task
+        if task is not None and not task.done():
+            task.cancel()
+        self._long_press_task = asyncio.create_task(self._confirm_long_press())
 
-    def on_released_irq(self, timer):
-        timer.deinit()
+    def on_released_irq(self, _):
         if not self._cycle_started:
             return
 
         current_ms = time.ticks_ms()
-        elapsed_ms = current_ms - self._released_at
-        if elapsed_ms < self.JITTER:
-            pass
+        # ticks_ms wraps around, only ticks_diff gives a valid interval
+        elapsed_ms = time.ticks_diff(current_ms, self._released_at)
 
         self._released_at = current_ms
         self._cycle_started = False
@@ -150,20 +144,18 @@ class ButtonController:
             logger.info(f"Button short pressed {self._listen_pin}")
             self._on_short_press()
 
-    def trigger(self, timer):
+    async def _confirm_long_press(self):
         """
-        Confirm the button is still pressed and execute the callback.
-
-        Args:
-            timer (machine.Timer): The timer used for debouncing.
+        Wait for the trigger delay and confirm the long press.
         """
-        timer.deinit()
-        state = self._listen_pin.value()
-        pressed = state
-        if self._inverted:
-            pressed = not state
+        await asyncio.sleep_ms(self._trigger_delay)
+        self.trigger()
 
-        if not pressed:
+    def trigger(self):
+        """
+        Confirm the button is still pressed and execute the callback.
+        """
+        if self._listen_pin.value() != self._pressed_value:
             return
 
         if self._on_long_press is not None:
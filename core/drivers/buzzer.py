@@ -22,13 +22,17 @@ class BuzzerController:
     Attributes:
         SIGNAL_PIN (int): Default pin for the buzzer signal.
         _event (asyncio.Event): Event object for asynchronous operations.
-        _timer (machine.Timer): Timer for managing buzzer timing.
+        _stop_task (asyncio.Task): Pending task stopping the current tone.
         _pwm (machine.PWM): PWM instance for controlling the buzzer.
     """
 
     SIGNAL_PIN = None
 
     _event = None
+    _stop_task = None
+
+    # frequency the PWM is currently configured for
+    _frequency = None
 
     def __init__(self, signal_pin=SIGNAL_PIN):
         """
@@ -38,45 +42,67 @@ class BuzzerController:
             signal_pin (int): The pin number for the buzzer signal.
         """
         self._event = asyncio.Event()
-        self._timer = machine.Timer(0)
 
         buzzer_pin = machine.Pin(signal_pin, machine.Pin.OUT)
         self._pwm = machine.PWM(buzzer_pin)
         self._pwm.duty(0)
 
+    def _beep(self, frequency):
+        """
+        Start a tone and schedule the buzzer to stop.
+
+        The PWM frequency is only reconfigured when it differs from the last tone.
+
+        Args:
+            frequency (int): The tone frequency in Hz.
+        """
+        if frequency != self._frequency:
+            self._pwm.freq(frequency)
+            self._frequency = frequency
+
+        self._pwm.duty(500)
+
+        # a newer tone restarts the stop countdown
+        task = self._stop_task
+        if task is not None and not task.done():
+            task.cancel()
+        self._stop_task = asyncio.create_task(self._stop_later(200))
+
+    async def _stop_later(self, delay):
+        """
+        Stop the buzzer after a delay.
+
+        Args:
+            delay (int): The delay in milliseconds.
+        """
+        await asyncio.sleep_ms(delay)
+        self.stop()
+
     def boot(self):
         """
         Emit a boot signal using the buzzer.
 
         This method sets the buzzer frequency and duty cycle, then stops the buzzer
-        after a short delay using a timer.
+        after a short delay.
         """
         logger.debug("Buzzer boot")
-        self._pwm.freq(400)
-        self._pwm.duty(500)
-        self._timer.init(period=200, mode=machine.Timer.ONE_SHOT, callback=self.stop)
+        self._beep(400)
 
     def powerup(self):
         """
         Emit a power-up signal using the buzzer.
 
         This method sets the buzzer frequency and duty cycle, then stops the buzzer
-        after a short delay using a timer.
+        after a short delay.
         """
         logger.debug("Buzzer power up")
-        self._pwm.freq(600)  # Set frequency
-        self._pwm.duty(500)
-        self._timer.init(period=200, mode=machine.Timer.ONE_SHOT, callback=self.stop)
+        self._beep(600)
 
-    def stop(self, timer=None):
+    def stop(self):
         """
         Stop the buzzer.
 
-        This method deinitializes the timer and sets the buzzer duty cycle to zero.
-
-        Args:
-            timer (machine.Timer, optional): The timer instance used to stop the buzzer.
+        This method sets the buzzer duty cycle to zero.
         """
-        self._timer.deinit()
         self._pwm.duty(0)
         logger.debug("Stopping buzzer")
@@ -5,7 +5,6 @@ This module provides the `DisplayController` class, which manages the display ha
 handles screen transitions, and updates the display based on system states.
 """
 
-import random
 import asyncio
 import time
 
@@ -1,5 +1,23 @@
 import lvgl as lv  # NOQA
 
+# label fonts by point size
+_FONTS = {
+    10: lv.font_montserrat_10,
+    12: lv.font_roboto_12,
+    24: lv.font_roboto_24,
+    120: lv.font_roboto_120,
+}
+
+# color names resolved to LVGL colors once at import, unknown names fall back to white
+_COLORS = {
+    "white": lv.color_hex(0x000000),
+    "grey": lv.color_hex(0x888888),
+    "red": lv.color_hex(0x44FFFF),
+    "green": lv.color_hex(0xFF44FF),
+    "blue": lv.color_hex(0xBB3200),
+}
+_DEFAULT_COLOR = _COLORS["white"]
+
 
 class BaseScreen:
     """
@@ -7,15 +25,40 @@ class BaseScreen:
 
     Attributes:
         _screen (lv.obj): The LVGL object representing the screen.
+        _texts (dict): Last text set through update_text, keyed by widget id.
+        _hidden (dict): Visibility set through set_hidden, keyed by widget id.
     """
 
     _screen = None
 
+    # last text shown by each widget, keyed by the widget id
+    _texts = None
+
+    # last visibility set on each widget, keyed by the widget id
+    _hidden = None
+
     def __init__(self):
         """
         Initializes the BaseScreen by creating a new LVGL object.
         """
         self._screen = lv.obj(None)
+        self._texts = {}
+        self._hidden = {}
+
+    def update_text(self, widget, text):
+        """
+        Sets the text of a widget unless it already shows the same text.
+
+        Skipping unchanged text avoids invalidating and redrawing the widget.
+
+        Args:
+            widget (lv.label): The widget to update.
+            text (str): The text to show.
+        """
+        key = id(widget)
+        if self._texts.get(key) != text:
+            widget.set_text(text)
+            self._texts[key] = text
 
     @staticmethod
     def hide_widget(widget):
@@ -37,6 +80,27 @@ class BaseScreen:
         """
         widget.remove_flag(lv.obj.FLAG.HIDDEN)
 
+    def set_hidden(self, widgets, hidden):
+        """
+        Shows or hides a group of widgets.
+
+        Widgets already in the requested state are skipped, so repeated calls do
+        not invalidate them again.
+
+        Args:
+            widgets (tuple): The widgets to update.
+            hidden (bool): Whether the widgets should be hidden.
+        """
+        states = self._hidden
+        for widget in widgets:
+            key = id(widget)
+            if states.get(key) is not hidden:
+                if hidden:
+                    widget.add_flag(lv.obj.FLAG.HIDDEN)
+                else:
+                    widget.remove_flag(lv.obj.FLAG.HIDDEN)
+                states[key] = hidden
+
     def get_screen(self):
         """
         Retrieves the underlying screen object.
@@ -147,17 +211,9 @@ class BaseScreen:
         label.set_style_size(lv.SIZE_CONTENT, lv.SIZE_CONTENT, 0)
         label.set_style_text_color(self.color_to_hex(color), 0)
 
-        if font_size == 12:
-            label.set_style_text_font(lv.font_roboto_12, 0)
-
-        if font_size == 120:
-            label.set_style_text_font(lv.font_roboto_120, 0)
-
-        if font_size == 10:
-            label.set_style_text_font(lv.font_montserrat_10, 0)
-
-        if font_size == 24:
-            label.set_style_text_font(lv.font_roboto_24, 0)
+        font = _FONTS.get(font_size)
+        if font is not None:
+            label.set_style_text_font(font, 0)
 
         if x is not None:
             label.set_style_x(x, lv.PART.MAIN)
@@ -243,21 +299,6 @@ class BaseScreen:
             color (str): The color name.
 
         Returns:
-            lv.color_hex: The corresponding LVGL color in hexadecimal.
+            lv.color_t: The corresponding LVGL color.
         """
-        if color == "white":
-            return lv.color_hex(0x000000)
-
-        if color == "grey":
-            return lv.color_hex(0x888888)
-
-        if color == "red":
-            return lv.color_hex(0x44FFFF)
-
-        if color == "green":
-            return lv.color_hex(0xFF44FF)
-
-        if color == "blue":
-            return lv.color_hex(0xBB3200)
-
-        return lv.color_hex(0x000000)
+        return _COLORS.get(color, _DEFAULT_COLOR)
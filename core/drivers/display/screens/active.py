@@ -22,6 +22,22 @@ DEVICE_PSU = micropython.const(1)
 DEVICE_INVERTER = micropython.const(2)
 DEVICE_MCU = micropython.const(3)
 
+# label formats applied with %, cheaper than f-strings on MicroPython
+_FORMAT_VOLTAGE = "%s В"
+_FORMAT_TEMPERATURE = "%s°С"
+_FORMAT_TEMPERATURES = "%s°С / %s°С"
+_FORMAT_PERCENT = "%s%%"
+_FORMAT_CURRENT = "%s%s%%"
+_FORMAT_AC_VOLTAGE = "%sВ"
+_FORMAT_RPM = "%s об/хв"
+_FORMAT_POWER = "%s Вт"
+_FORMAT_DISCHARGE_TIME = "До повного розряду %s"
+_FORMAT_CHARGE_TIME = "До повного заряду %s"
+
+# grid layout descriptors, built once and kept alive for LVGL's style references
+_GRID_COLUMNS = [40] * 12 + [lv.GRID_TEMPLATE_LAST]
+_GRID_ROWS = [24] * 13 + [lv.GRID_TEMPLATE_LAST]
+
 
 class ActiveScreen(BaseScreen):
     """
@@ -99,6 +115,11 @@ class ActiveScreen(BaseScreen):
 
     mcu_health_glyph = None
 
+    _error_widgets = None
+    _bms_widgets = None
+    _psu_widgets = None
+    _inverter_widgets = None
+
     def __init__(self):
         """
         Initializes the ActiveScreen by setting initial error states and creating the screen.
@@ -119,10 +140,10 @@ class ActiveScreen(BaseScreen):
             v3 (float): Voltage of cell 3.
             v4 (float): Voltage of cell 4.
         """
-        self.bms_voltage_cell_1.set_text(f"{v1} В")
-        self.bms_voltage_cell_2.set_text(f"{v2} В")
-        self.bms_voltage_cell_3.set_text(f"{v3} В")
-        self.bms_voltage_cell_4.set_text(f"{v4} В")
+        self.update_text(self.bms_voltage_cell_1, _FORMAT_VOLTAGE % v1)
+        self.update_text(self.bms_voltage_cell_2, _FORMAT_VOLTAGE % v2)
+        self.update_text(self.bms_voltage_cell_3, _FORMAT_VOLTAGE % v3)
+        self.update_text(self.bms_voltage_cell_4, _FORMAT_VOLTAGE % v4)
 
     def set_ats_mode(self, mode):
         """
@@ -132,13 +153,13 @@ class ActiveScreen(BaseScreen):
             mode (int): ATS mode (0, 1, or 2).
         """
         if mode == 0:
-            self.ats.set_text(chr(ICON_DOTS))
+            self.update_text(self.ats, chr(ICON_DOTS))
 
         if mode == 1:
-            self.ats.set_text(chr(ICON_CITY))
+            self.update_text(self.ats, chr(ICON_CITY))
 
         if mode == 2:
-            self.ats.set_text(chr(ICON_BATTERY))
+            self.update_text(self.ats, chr(ICON_BATTERY))
 
     def set_bms_temperature(
         self, temperature_mos, bms_temperature_bat_1, bms_temperature_bat_2
@@ -151,9 +172,15 @@ class ActiveScreen(BaseScreen):
             bms_temperature_bat_1 (int or float): Temperature of battery sensor 1.
             bms_temperature_bat_2 (int or float): Temperature of battery sensor 2.
         """
-        self.bms_temperature_mos.set_text(f"{temperature_mos}°С")
-        self.bms_temperature_bat_1.set_text(f"{bms_temperature_bat_1}°С")
-        self.bms_temperature_bat_2.set_text(f"{bms_temperature_bat_2}°С")
+        self.update_text(
+            self.bms_temperature_mos, _FORMAT_TEMPERATURE % temperature_mos
+        )
+        self.update_text(
+            self.bms_temperature_bat_1, _FORMAT_TEMPERATURE % bms_temperature_bat_1
+        )
+        self.update_text(
+            self.bms_temperature_bat_2, _FORMAT_TEMPERATURE % bms_temperature_bat_2
+        )
 
     def set_version(self, version):
         """
@@ -162,7 +189,7 @@ class ActiveScreen(BaseScreen):
         Args:
             version (str): Version information.
         """
-        self.version.set_text(version)
+        self.update_text(self.version, version)
 
     def set_capacity(self, value):
         """
@@ -172,7 +199,7 @@ class ActiveScreen(BaseScreen):
             value (int): Battery capacity percentage.
         """
         if value is not None:
-            self.capacity.set_text(f"{value}%")
+            self.update_text(self.capacity, _FORMAT_PERCENT % value)
             self.capacity_bar.set_value(value, lv.ANIM.OFF)
             self.capacity_bar.invalidate()
 
@@ -188,12 +215,12 @@ class ActiveScreen(BaseScreen):
             current (int): Current mode.
         """
         if t1 and t2:
-            self.psu_temperature.set_text(f"{t1}°С / {t2}°С")
+            self.update_text(self.psu_temperature, _FORMAT_TEMPERATURES % (t1, t2))
         if ac_voltage:
-            self.psu_ac_voltage.set_text(f"{ac_voltage}В")
+            self.update_text(self.psu_ac_voltage, _FORMAT_AC_VOLTAGE % ac_voltage)
         if current:
             turbo = "МАКС " if turbo else ""
-            self.psu_current.set_text(f"{turbo}{current}%")
+            self.update_text(self.psu_current, _FORMAT_CURRENT % (turbo, current))
 
     def set_inverter_state(self, temperature, ac_voltage, rpm):
         """
@@ -205,11 +232,13 @@ class ActiveScreen(BaseScreen):
             rpm (int): Inverter fan RPM.
         """
         if temperature:
-            self.inverter_temperature.set_text(f"{temperature}°С")
+            self.update_text(
+                self.inverter_temperature, _FORMAT_TEMPERATURE % temperature
+            )
         if ac_voltage:
-            self.inverter_ac_voltage.set_text(f"{ac_voltage}В")
+            self.update_text(self.inverter_ac_voltage, _FORMAT_AC_VOLTAGE % ac_voltage)
         if rpm:
-            self.inverter_rpm.set_text(f"{rpm} об/хв")
+            self.update_text(self.inverter_rpm, _FORMAT_RPM % rpm)
 
     def set_power_consumption(self, direction, power, seconds):
         """
@@ -221,98 +250,54 @@ class ActiveScreen(BaseScreen):
             seconds (int): Time in seconds until full charge/discharge.
         """
         if power is not None:
-            self.power.set_text(f"{power} Вт")
+            self.update_text(self.power, _FORMAT_POWER % power)
 
         if direction:
-            self.power_timer.set_text(f"До повного розряду {seconds}")
+            self.update_text(self.power_timer, _FORMAT_DISCHARGE_TIME % seconds)
         else:
-            self.power_timer.set_text(f"До повного заряду {seconds}")
+            self.update_text(self.power_timer, _FORMAT_CHARGE_TIME % seconds)
 
     def show_error_state(self):
         """
         Displays the error state by showing associated widgets.
         """
-        self.show_widget(self.error_glyph)
-        self.show_widget(self.error_label)
-        self.show_widget(self.error)
+        self.set_hidden(self._error_widgets, False)
 
     def hide_error_state(self):
         """
         Hides the error state widgets.
         """
-        self.hide_widget(self.error_glyph)
-        self.hide_widget(self.error_label)
-        self.hide_widget(self.error)
+        self.set_hidden(self._error_widgets, True)
 
     def show_bms_state(self):
         """
         Displays the battery management system state by showing relevant widgets.
         """
-        self.show_widget(self.bms_voltage_label)
-        self.show_widget(self.bms_temperature_label)
-        self.show_widget(self.power_label)
-
-        self.show_widget(self.capacity)
-        self.show_widget(self.capacity_bar)
-
-        self.show_widget(self.bms_voltage_cell_1)
-        self.show_widget(self.bms_voltage_cell_2)
-        self.show_widget(self.bms_voltage_cell_3)
-        self.show_widget(self.bms_voltage_cell_4)
-
-        self.show_widget(self.bms_temperature_mos)
-        self.show_widget(self.bms_temperature_bat_1)
-        self.show_widget(self.bms_temperature_bat_2)
-
-        self.show_widget(self.power)
+        self.set_hidden(self._bms_widgets, False)
 
     def show_psu_state(self):
         """
         Displays the PSU state by showing relevant widgets.
         """
-        self.show_widget(self.psu_label)
-        self.show_widget(self.psu_temperature)
-        self.show_widget(self.psu_current)
-        self.show_widget(self.psu_ac_voltage)
-        self.show_widget(self.power_in_glyph_a)
-        self.show_widget(self.power_in_glyph_b)
-        self.show_widget(self.power_timer)
+        self.set_hidden(self._psu_widgets, False)
 
     def hide_psu_state(self):
         """
         Hides the PSU state widgets.
         """
-        self.hide_widget(self.psu_label)
-        self.hide_widget(self.psu_temperature)
-        self.hide_widget(self.psu_current)
-        self.hide_widget(self.psu_ac_voltage)
-        self.hide_widget(self.power_in_glyph_a)
-        self.hide_widget(self.power_in_glyph_b)
-        self.hide_widget(self.power_timer)
+        self.set_hidden(self._psu_widgets, True)
 
     def show_inverter_state(self):
         """
         Displays the inverter state by showing relevant widgets.
         """
-        self.show_widget(self.inverter_label)
-        self.show_widget(self.inverter_temperature)
-        self.show_widget(self.inverter_rpm)
-        self.show_widget(self.inverter_ac_voltage)
-        self.show_widget(self.power_out_glyph_a)
-        self.show_widget(self.power_out_glyph_b)
-        self.show_widget(self.power_timer)
+        self.set_hidden(self._inverter_widgets, False)
 
     def hide_inverter_state(self):
         """
         Hides the inverter state widgets.
         """
-        self.hide_widget(self.inverter_label)
-        self.hide_widget(self.inverter_temperature)
-        self.hide_widget(self.inverter_rpm)
-        self.hide_widget(self.inverter_ac_voltage)
-        self.hide_widget(self.power_out_glyph_a)
-        self.hide_widget(self.power_out_glyph_b)
-        self.hide_widget(self.power_timer)
+        self.set_hidden(self._inverter_widgets, True)
 
     def set_error(self, device_id, error):
         """
@@ -338,7 +323,7 @@ class ActiveScreen(BaseScreen):
             if self.errors[DEVICE_MCU]:
                 codes.append(f"4{self.errors[DEVICE_MCU]}")
 
-            self.error.set_text(" ".join(codes))
+            self.update_text(self.error, " ".join(codes))
             self.show_error_state()
 
     def reset_error(self, device_id):
@@ -362,11 +347,8 @@ class ActiveScreen(BaseScreen):
         self._screen.set_style_margin_all(0, lv.PART.MAIN)
         self._screen.set_style_pad_gap(0, lv.PART.MAIN)
 
-        col_dsc = [40] * 12 + [lv.GRID_TEMPLATE_LAST]
-        row_dsc = [24] * 13 + [lv.GRID_TEMPLATE_LAST]
-
-        self._screen.set_style_grid_column_dsc_array(col_dsc, lv.PART.MAIN)
-        self._screen.set_style_grid_row_dsc_array(row_dsc, lv.PART.MAIN)
+        self._screen.set_style_grid_column_dsc_array(_GRID_COLUMNS, lv.PART.MAIN)
+        self._screen.set_style_grid_row_dsc_array(_GRID_ROWS, lv.PART.MAIN)
 
         # cell voltage
         self.bms_voltage_label = self.create_label(
@@ -513,6 +495,42 @@ class ActiveScreen(BaseScreen):
         )
         self.error = self.create_label(10, 6, col_span=2, font_size=12, color="red")
 
+        # widgets shown and hidden together
+        self._error_widgets = (self.error_glyph, self.error_label, self.error)
+        self._bms_widgets = (
+            self.bms_voltage_label,
+            self.bms_temperature_label,
+            self.power_label,
+            self.capacity,
+            self.capacity_bar,
+            self.bms_voltage_cell_1,
+            self.bms_voltage_cell_2,
+            self.bms_voltage_cell_3,
+            self.bms_voltage_cell_4,
+            self.bms_temperature_mos,
+            self.bms_temperature_bat_1,
+            self.bms_temperature_bat_2,
+            self.power,
+        )
+        self._psu_widgets = (
+            self.psu_label,
+            self.psu_temperature,
+            self.psu_current,
+            self.psu_ac_voltage,
+            self.power_in_glyph_a,
+            self.power_in_glyph_b,
+            self.power_timer,
+        )
+        self._inverter_widgets = (
+            self.inverter_label,
+            self.inverter_temperature,
+            self.inverter_rpm,
+            self.inverter_ac_voltage,
+            self.power_out_glyph_a,
+            self.power_out_glyph_b,
+            self.power_timer,
+        )
+
         self._screen.set_layout(lv.LAYOUT.GRID)
 
     def _generate_random_state(self):
@@ -676,8 +694,8 @@ class ActiveScreen(BaseScreen):
             return
 
         self.reset_error(DEVICE_MCU)
-        self.mcu_temperature.set_text(f"{state.temperature}°С")
-        self.mcu_memory.set_text(f"{state.memory}%")
+        self.update_text(self.mcu_temperature, _FORMAT_TEMPERATURE % state.temperature)
+        self.update_text(self.mcu_memory, _FORMAT_PERCENT % state.memory)
 
     def on_ble_state(self, state):
         """
@@ -4,6 +4,8 @@ import lvgl as lv  # NOQA
 
 from drivers.display.screens import BaseScreen
 
+_FORMAT_PERCENT = "%s%%"
+
 
 class IdleScreen(BaseScreen):
     """
@@ -166,7 +168,7 @@ class IdleScreen(BaseScreen):
         end_angle = self.progress_body.get_bg_angle_end()
         offset = int((100 - value) * (end_angle - start_angle) / 100)
         self.progress_body.set_angles(start_angle + offset, end_angle)
-        self.capacity.set_text(f"{value}%")
+        self.update_text(self.capacity, _FORMAT_PERCENT % value)
 
     def generate_random_state(self):
         """
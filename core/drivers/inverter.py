@@ -72,20 +72,27 @@ class InverterState(BaseState):
     rpm_b = None
     _valid = False
 
-    history = {
-        HISTORY_INVERTER_POWER: HistoricalData(
-            chart_type=HISTORY_INVERTER_POWER,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_INVERTER_RPM: HistoricalData(
-            chart_type=HISTORY_INVERTER_RPM,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_INVERTER_TEMPERATURE: HistoricalData(
-            chart_type=HISTORY_INVERTER_TEMPERATURE,
-            data_type=DATA_TYPE_BYTE,
-        ),
-    }
+    history = None
+
+    def __init__(self):
+        """
+        Initializes the inverter state with its own history buffers.
+        """
+        super().__init__()
+        self.history = {
+            HISTORY_INVERTER_POWER: HistoricalData(
+                chart_type=HISTORY_INVERTER_POWER,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_INVERTER_RPM: HistoricalData(
+                chart_type=HISTORY_INVERTER_RPM,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_INVERTER_TEMPERATURE: HistoricalData(
+                chart_type=HISTORY_INVERTER_TEMPERATURE,
+                data_type=DATA_TYPE_BYTE,
+            ),
+        }
 
     def clear(self):
         """
@@ -270,9 +277,9 @@ class InverterState(BaseState):
         transmission over Bluetooth Low Energy.
 
         Returns:
-            bytes: The packed BLE state of the inverter.
+            memoryview: The packed BLE state of the inverter.
         """
-        return struct.pack(
+        return self._pack_ble_state(
             ">HHBBBBB",
             self._pack(self.power),
             self._pack(self.get_avg_rpm()),
@@ -335,7 +342,6 @@ class InverterController:
     def __init__(
         self,
         power_button_pin=POWER_BUTTON_PIN,
-        power_button_timer=-1,
         power_gate_pin=POWER_GATE_PIN,
         uart=None,
         baud_rate=BAUD_RATE,
@@ -356,7 +362,6 @@ class InverterController:
 
         Args:
             power_button_pin (int): Pin for the power button.
-            power_button_timer (int): Timer for the power button debouncing.
             power_gate_pin (int): Pin for the power gate control.
             uart (UART): UART instance for communication with the inverter.
             baud_rate (int): Baud rate for UART communication.
@@ -382,7 +387,6 @@ class InverterController:
             listen_pin=power_button_pin,
             on_long_press=self.on_power_trigger,
             buzzer=buzzer,
-            trigger_timer=power_button_timer,
             inverted=True,
         )
 
@@ -7,7 +7,6 @@ including memory usage, temperature monitoring, and heartbeat functionality.
 """
 
 import gc
-import struct
 import time
 
 import esp32
@@ -56,11 +55,11 @@ class MCUState(BaseState):
         Get the BLE representation of the MCU state.
 
         Returns:
-            bytes: The packed BLE state of the MCU, including uptime, version,
-                   temperature, memory usage, and internal errors.
+            memoryview: The packed BLE state of the MCU, including uptime, version,
+                        temperature, memory usage, and internal errors.
         """
         uptime = int(time.time())
-        return struct.pack(
+        return self._pack_ble_state(
             ">IBBBB",
             self._pack(uptime),
             self._pack_version(version.FIRMWARE),
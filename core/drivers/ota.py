@@ -1,4 +1,3 @@
-import struct
 import time
 
 import network
@@ -29,7 +28,7 @@ class OTAState(BaseState):
 
     def get_ble_state(self):
         logger.debug("Getting OTA BLE state")
-        return struct.pack(
+        return self._pack_ble_state(
             ">BBB",
             self._pack(self.status),
             self._pack(self.progress),
@@ -90,28 +90,35 @@ class PSUState(BaseState):
     _power_crc = None
     _data_crc = None
 
-    history = {
-        HISTORY_PSU_RPM: HistoricalData(
-            chart_type=HISTORY_PSU_RPM,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_PSU_POWER_1: HistoricalData(
-            chart_type=HISTORY_PSU_POWER_1,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_PSU_POWER_2: HistoricalData(
-            chart_type=HISTORY_PSU_POWER_2,
-            data_type=DATA_TYPE_WORD,
-        ),
-        HISTORY_PSU_TEMPERATURE_1: HistoricalData(
-            chart_type=HISTORY_PSU_TEMPERATURE_1,
-            data_type=DATA_TYPE_BYTE,
-        ),
-        HISTORY_PSU_TEMPERATURE_2: HistoricalData(
-            chart_type=HISTORY_PSU_TEMPERATURE_2,
-            data_type=DATA_TYPE_BYTE,
-        ),
-    }
+    history = None
+
+    def __init__(self):
+        """
+        Initializes the PSU state with its own history buffers.
+        """
+        super().__init__()
+        self.history = {
+            HISTORY_PSU_RPM: HistoricalData(
+                chart_type=HISTORY_PSU_RPM,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_PSU_POWER_1: HistoricalData(
+                chart_type=HISTORY_PSU_POWER_1,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_PSU_POWER_2: HistoricalData(
+                chart_type=HISTORY_PSU_POWER_2,
+                data_type=DATA_TYPE_WORD,
+            ),
+            HISTORY_PSU_TEMPERATURE_1: HistoricalData(
+                chart_type=HISTORY_PSU_TEMPERATURE_1,
+                data_type=DATA_TYPE_BYTE,
+            ),
+            HISTORY_PSU_TEMPERATURE_2: HistoricalData(
+                chart_type=HISTORY_PSU_TEMPERATURE_2,
+                data_type=DATA_TYPE_BYTE,
+            ),
+        }
 
     def clear(self):
         """
@@ -150,11 +157,11 @@ class PSUState(BaseState):
         Packs the current state data into a binary format for BLE transmission.
 
         Returns:
-            bytes: A packed representation of the PSU state for BLE communication.
+            memoryview: A packed representation of the PSU state for BLE communication.
         """
         t1 = self.get_avg_temperature()
 
-        return struct.pack(
+        return self._pack_ble_state(
             ">HHHBBBBBBB",
             self._pack(self.rpm),
             self._pack(self.power1),
@@ -420,7 +427,6 @@ class PowerSupplyController:
     def __init__(
         self,
         power_button_pin=POWER_BUTTON_PIN,
-        power_button_timer=None,
         power_gate_pin=POWER_GATE_PIN,
         current_a_pin=CURRENT_A_PIN,
         current_b_pin=CURRENT_B_PIN,
@@ -439,7 +445,6 @@ class PowerSupplyController:
 
         Args:
             power_button_pin (int): GPIO pin for the power button input.
-            power_button_timer (int, optional): Timer ID for button debouncing.
             power_gate_pin (int): GPIO pin for controlling the PSU power MOSFET.
             current_a_pin (int): GPIO pin A for current channel selection (LSB).
             current_b_pin (int): GPIO pin B for current channel selection (MSB).
@@ -468,7 +473,7 @@ class PowerSupplyController:
         # Initialize hardware components
         self._uart.init(rx=self._uart_rx_pin, baud_rate=4800)
         self._initialize_tachometer(fan_tachometer_pin, fan_tachometer_timer)
-        self._initialize_power_button(power_button_pin, power_button_timer, buzzer)
+        self._initialize_power_button(power_button_pin, buzzer)
         self._initialize_power_gate(power_gate_pin)
         self._initialize_current_control(current_a_pin, current_b_pin)
 
@@ -484,16 +489,15 @@ class PowerSupplyController:
                 timer_id=timer_id,
             )
 
-    def _initialize_power_button(self, pin, timer_id, buzzer):
+    def _initialize_power_button(self, pin, buzzer):
         """Initialize the power button controller."""
-        logger.info(f"Initializing PSU power button on pin {pin} timer {timer_id}")
+        logger.info(f"Initializing PSU power button on pin {pin}")
         try:
             self._power_button = ButtonController(
                 listen_pin=pin,
                 on_long_press=self.on_power_trigger,
                 on_short_press=self.toggle_turbo_mode,
                 buzzer=buzzer,
-                trigger_timer=timer_id,
             )
         except Exception as e:
             self._state.set_error(self._state.ERROR_PIN)
@@ -195,6 +195,31 @@ class InstructionsQueue:
         """
         self._instructions.put_nowait((callback, args, kwargs))
 
+    @staticmethod
+    def prepare(callback, *args, **kwargs):
+        """Build an instruction once so it can be queued repeatedly.
+        
+        Args:
+            callback: The function to be executed
+            *args: Positional arguments to be passed to the callback
+            **kwargs: Keyword arguments to be passed to the callback
+            
+        Returns:
+            tuple: The instruction accepted by add_prepared().
+        """
+        return callback, args, kwargs
+
+    def add_prepared(self, instruction):
+        """Add an instruction built by prepare() to the queue.
+        
+        Unlike add(), this does not allocate a new instruction tuple, which
+        keeps IRQ handlers queueing fixed actions allocation free.
+        
+        Args:
+            instruction: The instruction returned by prepare()
+        """
+        self._instructions.put_nowait(instruction)
+
     async def run(self):
         """Run the instructions queue continuously.
         
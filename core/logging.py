@@ -145,6 +145,18 @@ class Logger:
         """
         self._level = level
 
+    def is_enabled(self, level):
+        """
+        Check whether messages of the given level would be logged.
+
+        Args:
+            level (int): The log level.
+
+        Returns:
+            bool: True if the level passes the configured threshold.
+        """
+        return level <= self._level
+
     def debug(self, *messages):
         """
         Log a debug message.